@@ -4,7 +4,7 @@ import weaviate
 import sys
 
 from sentence_transformers import SentenceTransformer
-from backend.db import get_db_schema, run_query
+from backend.db import get_db_schema, get_column_values, run_query
 from backend.create_kb import parse_db_schema_markdown, setup_weaviate_collection, \
                                 test_query, incremental_upsert, auto_delete_missing_tables
 
@@ -43,6 +43,14 @@ if upload_embeddings:
     except Exception as e:
         sys.exit(f"❌ Could not connect to Weaviate: {e}")
 
+build_value_index = st.button("Build column value index.")
+if build_value_index:
+    try:
+        values_file_path, num_columns = get_column_values()
+        st.success(f"Indexed values of {num_columns} columns in {values_file_path}.")
+    except Exception as e:
+        st.error(f"❌ Could not build column value index: {e}")
+
 
 vector_query = st.chat_input(
     "Insert vector DB Query here.",
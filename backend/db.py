@@ -5,6 +5,8 @@ import json
 from pathlib import Path
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.types import String
 
 # Loading environement variables
 load_dotenv()
@@ -115,4 +117,135 @@ def get_db_schema():
     md_file_path = "backend/db_metadata/db_schema.md"
     print(f"Markdown file created at {md_file_path}")
 
-    return md_file_path
\ No newline at end of file
+    return md_file_path
+
+
+# Function to sample distinct values of low-cardinality text columns
+def get_column_values(max_distinct: int = 500, sample_rows: int = 10000, max_value_len: int = 64):
+
+    """
+    Build an offline index of literal values for low-cardinality text columns.
+
+    Values come from the planner statistics in pg_stats (most common values) and,
+    where those do not cover the column, from a bounded DISTINCT over at most
+    `sample_rows` rows. Tables larger than that are read with TABLESAMPLE SYSTEM, so
+    rare values can be missed; tables without a row estimate fall back to a prefix scan.
+    Columns with more than `max_distinct` estimated values are skipped.
+    """
+
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+
+    # Column values will be populated in this dictionary as {table: {column: [values]}}
+    value_index = {}
+    Path("backend/db_metadata").mkdir(parents=True, exist_ok=True)
+
+    with engine.connect() as conn:
+
+        # Row estimates resolve negative n_distinct and size the fallback sample.
+        # A partitioned parent has no rows of its own, so it is sized by its partitions.
+        reltuples = {}
+        partitioned = set()
+        partitions = set()
+        for row in conn.execute(text(
+            """
+            SELECT c.relname, c.relkind, c.relispartition,
+                   CASE WHEN c.relkind = 'p' THEN (
+                       SELECT COALESCE(SUM(GREATEST(child.reltuples, 0)), 0)
+                       FROM pg_inherits i
+                       JOIN pg_class child ON child.oid = i.inhrelid
+                       WHERE i.inhparent = c.oid
+                   ) ELSE c.reltuples END AS reltuples
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = current_schema()
+            """
+        )):
+            reltuples[row.relname] = row.reltuples
+            if row.relkind == "p":
+                partitioned.add(row.relname)
+            # Partitions are queried via their parent table, so they are not indexed
+            if row.relispartition:
+                partitions.add(row.relname)
+
+        # Planner statistics for all columns. Partitioned parents only have the
+        # `inherited` rows (covering all partitions); other tables use their own rows.
+        stats = {}
+        for row in conn.execute(text(
+            """
+            SELECT tablename, attname, inherited, n_distinct,
+                   most_common_vals::text::text[] AS most_common_vals
+            FROM pg_stats
+            WHERE schemaname = current_schema()
+            """
+        )):
+            if row.inherited == (row.tablename in partitioned):
+                stats[(row.tablename, row.attname)] = row
+
+        for table in inspector.get_table_names():
+
+            if table in partitions:
+                continue
+
+            for col in inspector.get_columns(table):
+
+                if not isinstance(col["type"], String):
+                    continue
+
+                stat = stats.get((table, col["name"]))
+                values = None
+
+                if stat is not None:
+                    if stat.n_distinct >= 0:
+                        est_distinct = stat.n_distinct
+                    else:
+                        est_distinct = -stat.n_distinct * max(reltuples.get(table, 0), 0)
+                    if est_distinct > max_distinct:
+                        continue
+                    mcv = stat.most_common_vals or []
+                    if mcv and len(mcv) >= est_distinct:
+                        values = mcv
+
+                if values is None:
+                    # Bounded sampling; one extra row tells us the column is not low-cardinality
+                    column = preparer.quote(col["name"])
+                    table_rows = reltuples.get(table, 0)
+                    tablesample = ""
+                    if table_rows > sample_rows:
+                        tablesample = f"TABLESAMPLE SYSTEM ({100 * sample_rows / table_rows:.6f})"
+                    try:
+                        # Savepoint, so a failing column does not abort the rest of the build
+                        with conn.begin_nested():
+                            result = conn.execute(text(
+                                f"""
+                                SELECT DISTINCT CAST(s.{column} AS TEXT)
+                                FROM (
+                                    SELECT {column} FROM {preparer.quote(table)} {tablesample}
+                                    WHERE {column} IS NOT NULL
+                                    LIMIT :sample_rows
+                                ) AS s
+                                LIMIT :limit
+                                """
+                            ), {"sample_rows": sample_rows, "limit": max_distinct + 1})
+                            values = [row[0] for row in result]
+                    except SQLAlchemyError as e:
+                        print(f"Skipped column {table}.{col['name']}: {e}")
+                        continue
+                    if len(values) > max_distinct:
+                        continue
+
+                # Strip the blank padding of char(n) values before filtering and deduping
+                values = {v.strip() for v in values if v}
+                values = sorted(v for v in values if v and len(v) <= max_value_len)
+                if values:
+                    value_index.setdefault(table, {})[col["name"]] = values
+
+    # Save as JSON; write to a temp file and swap it in so the chat never reads a partial file
+    values_file_path = "backend/db_metadata/column_values.json"
+    tmp_file_path = f"{values_file_path}.tmp"
+    Path(tmp_file_path).write_text(json.dumps(value_index, indent=2))
+    os.replace(tmp_file_path, values_file_path)
+    num_columns = sum(len(cols) for cols in value_index.values())
+    print(f"Column value index with {num_columns} columns created at {values_file_path}")
+
+    return values_file_path, num_columns
@@ -1,6 +1,7 @@
 import weaviate
 import textwrap
 from sentence_transformers import SentenceTransformer
+from backend.value_index import get_value_hints
 
 
 WEAVIATE_COLLECTION = 'DBSchema'
@@ -17,14 +18,17 @@ def get_schema_context(client: weaviate.Client, user_query: str, top_k=num_entri
         near_vector=query_vec,
         limit=top_k
     )
-    if not results.objects:
-        return ""
 
     context_parts = []
     for obj in results.objects:
         tbl = obj.properties["tableName"]
         schema = obj.properties["schemaText"]
         context_parts.append(f"### {tbl}\n{schema}")
+
+    # Value hints come from a local index, so they are kept even if schema retrieval finds nothing
+    value_hints = get_value_hints(user_query)
+    if value_hints:
+        context_parts.append("### Known column values\n" + "\n".join(value_hints))
     return "\n\n".join(context_parts)
 
 
@@ -37,6 +41,7 @@ def build_sql_prompt(user_query: str, schema_context: str) -> str:
         Note that the payment table consists of multiple partitions, but you should access them via the main table name 'payment'.
         Do not use the individual partition names like 'payment_p2022_05' in the SQL.
         Also make sure that all the column names that you are using actually exist in the database.
+        When the context lists known column values, use those exact columns and spellings for literals in the question.
 
         Database schema context:
         {schema_context}
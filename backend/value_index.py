@@ -0,0 +1,178 @@
+import json
+import math
+import re
+from collections import defaultdict
+from pathlib import Path
+
+
+value_index_path = Path("backend/db_metadata/column_values.json")
+value_match_threshold = 0.6
+max_value_hints = 10
+max_span_words = 4
+
+# Function words and question verbs that are only treated as literals when written like a code or name
+COMMON_WORDS = {
+    "a", "all", "am", "an", "and", "any", "are", "as", "at", "be", "by", "can", "do", "each",
+    "find", "for", "from", "get", "give", "had", "has", "have", "how", "i", "if", "in", "is",
+    "it", "list", "many", "me", "more", "most", "much", "my", "new", "no", "not", "of", "ok",
+    "on", "or", "our", "per", "show", "so", "than", "that", "the", "their", "them", "then",
+    "there", "these", "they", "this", "to", "top", "up", "us", "was", "we", "were", "what",
+    "when", "where", "which", "who", "why", "will", "with", "you", "your",
+}
+
+
+#### Column value index (built offline by backend.db.get_column_values)
+_value_index = {"source": None, "entries": [], "exact": {}, "vocab": {}, "trigrams": {}, "max_words": 0}
+
+
+def _tokens(text: str) -> list:
+    return re.sub(r"[^\w\s]", " ", text).split()
+
+
+def _normalize(value: str) -> str:
+    return " ".join(token.lower() for token in _tokens(value))
+
+
+def _trigrams(value: str) -> set:
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _is_literal_token(token: str, position: int) -> bool:
+
+    """
+    Decide whether a question token may be matched on its own.
+
+    Common words ("in", "or", "new") count only mid-sentence and capitalised ("IN", "New"),
+    other short tokens only in upper case ("PG", "R"). Tokens with digits always count.
+    """
+
+    if any(ch.isdigit() for ch in token):
+        return True
+    word = token.lower()
+    if word in COMMON_WORDS:
+        return position > 0 and token[0].isupper()
+    if len(word) < 3:
+        return token.isupper()
+    return True
+
+
+def _load_value_index() -> dict:
+
+    """
+    Load the column value index into in-memory lookups, reloading when the file changes.
+
+    `exact` maps each normalized value (and its space-free form, so "pg13" finds "PG-13")
+    to entry ids. `vocab` and `trigrams` hold the words used by the values and a
+    trigram -> words inverted index, used to correct misspelt words in the question.
+    If the file is missing or unreadable, the previously loaded index is kept.
+    """
+
+    try:
+        source = (value_index_path, value_index_path.stat().st_mtime)
+        if source == _value_index["source"]:
+            return _value_index
+        raw_index = json.loads(value_index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return _value_index
+
+    entries = []
+    exact = defaultdict(list)
+    vocab = {}
+    trigrams = defaultdict(list)
+    max_words = 0
+    for table, columns in raw_index.items():
+        for column, values in columns.items():
+            for value in values:
+                norm = _normalize(value)
+                if not norm:
+                    continue
+                for key in {norm, norm.replace(" ", "")}:
+                    exact[key].append(len(entries))
+                entries.append((table, column, value))
+                for word in norm.split():
+                    if word not in vocab:
+                        vocab[word] = frozenset(_trigrams(word))
+                        for gram in vocab[word]:
+                            trigrams[gram].append(word)
+                max_words = max(max_words, len(norm.split()))
+
+    _value_index.update(
+        source=source, entries=entries, exact=dict(exact), vocab=vocab,
+        trigrams=dict(trigrams), max_words=max_words
+    )
+    return _value_index
+
+
+def _closest_word(index: dict, word: str, threshold: float):
+
+    """
+    Return (vocab word, score) with the highest trigram similarity to `word`, or (None, 0).
+
+    A word with similarity >= threshold shares at least ceil(threshold * n) of the n trigrams
+    of `word`, so it must contain one of the n - ceil(threshold * n) + 1 rarest ones.
+    Only those posting lists are scanned.
+    """
+
+    word_grams = _trigrams(word)
+    num_grams = len(word_grams)
+    rarest = sorted(word_grams, key=lambda gram: len(index["trigrams"].get(gram, ())))
+    candidates = set()
+    for gram in rarest[:num_grams - math.ceil(threshold * num_grams) + 1]:
+        candidates.update(index["trigrams"].get(gram, ()))
+
+    best_word, best_score = None, 0
+    for candidate in candidates:
+        candidate_grams = index["vocab"][candidate]
+        shared = len(word_grams & candidate_grams)
+        score = shared / (num_grams + len(candidate_grams) - shared)
+        if score >= threshold and score > best_score:
+            best_word, best_score = candidate, score
+    return best_word, best_score
+
+
+def get_value_hints(user_query: str, threshold=value_match_threshold, limit=max_value_hints) -> list:
+
+    """Match word spans of the question against indexed column values and return `table.column = 'value'` hints."""
+
+    index = _load_value_index()
+    if not index["entries"]:
+        return []
+
+    tokens = _tokens(user_query)
+    words = [token.lower() for token in tokens]
+    literal = [_is_literal_token(token, i) for i, token in enumerate(tokens)]
+
+    # Correct misspelt words the index does not know
+    scores = [1.0] * len(words)
+    for i, word in enumerate(words):
+        if word in index["vocab"] or len(word) < 3 or word in COMMON_WORDS:
+            continue
+        closest, score = _closest_word(index, word, threshold)
+        if closest:
+            words[i], scores[i] = closest, score
+
+    # Longest spans first, so "PG-13" is not also reported as "PG"
+    best = {}
+    covered = set()
+    for n in range(min(index["max_words"], max_span_words), 0, -1):
+        for i in range(len(words) - n + 1):
+            positions = set(range(i, i + n))
+            if positions <= covered or not any(literal[i:i + n]):
+                continue
+            span = " ".join(words[i:i + n])
+            entry_ids = index["exact"].get(span) or index["exact"].get(span.replace(" ", ""), ())
+            if not entry_ids:
+                continue
+            covered |= positions
+            score = min(scores[i:i + n])
+            for entry_id in entry_ids:
+                if score > best.get(entry_id, 0):
+                    best[entry_id] = score
+
+    hints = []
+    for entry_id in sorted(best, key=best.get, reverse=True)[:limit]:
+        table, column, value = index["entries"][entry_id]
+        escaped = value.replace("'", "''")
+        hints.append(f"{table}.{column} = '{escaped}'")
+    return hints
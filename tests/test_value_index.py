@@ -0,0 +1,53 @@
+import json
+import os
+
+import pytest
+
+from backend import value_index
+
+
+@pytest.fixture
+def index_file(tmp_path, monkeypatch):
+    path = tmp_path / "column_values.json"
+    path.write_text(json.dumps({
+        "film": {"rating": ["G", "NC-17", "PG", "PG-13", "R"]},
+        "category": {"name": ["Action", "New", "Sci-Fi"]},
+        "address": {"state": ["California", "IN", "ME", "OH", "OK", "OR", "Texas"]},
+        "city": {"city": ["New York"]},
+    }))
+    monkeypatch.setattr(value_index, "value_index_path", path)
+    return path
+
+
+def test_exact_match(index_file):
+    assert value_index.get_value_hints("How many customers live in Texas?") == ["address.state = 'Texas'"]
+
+
+def test_space_free_match(index_file):
+    assert value_index.get_value_hints("list pg13 films") == ["film.rating = 'PG-13'"]
+    assert value_index.get_value_hints("list sci fi films") == ["category.name = 'Sci-Fi'"]
+
+
+def test_misspelling(index_file):
+    assert value_index.get_value_hints("customers in Califrnia") == ["address.state = 'California'"]
+
+
+def test_nested_spans(index_file):
+    assert value_index.get_value_hints("list PG-13 films") == ["film.rating = 'PG-13'"]
+    assert value_index.get_value_hints("stores in new york") == ["city.city = 'New York'"]
+
+
+def test_short_and_common_words(index_file):
+    assert value_index.get_value_hints("how many customers in Texas or Ohio") == ["address.state = 'Texas'"]
+    assert value_index.get_value_hints("is it ok to show me pg-13 films") == ["film.rating = 'PG-13'"]
+    assert value_index.get_value_hints("list new films") == []
+    assert value_index.get_value_hints("films rated R or PG") == ["film.rating = 'R'", "film.rating = 'PG'"]
+    assert value_index.get_value_hints("customers in OH") == ["address.state = 'OH'"]
+
+
+def test_unreadable_file_keeps_previous_index(index_file):
+    value_index.get_value_hints("Texas")
+    mtime = index_file.stat().st_mtime
+    index_file.write_text('{"film": {"rating": ')
+    os.utime(index_file, (mtime + 1, mtime + 1))
+    assert value_index.get_value_hints("How many customers live in Texas?") == ["address.state = 'Texas'"]